@@ -1,16 +1,25 @@
 
 # %%
-import requests
-from requests.exceptions import ConnectTimeout, ReadTimeout
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from lxml import etree
+from lxml import html as lxml_html
 import re
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import multiprocessing
 from time import sleep
 from urllib.parse import urlparse, parse_qs
+from html import unescape
 from tqdm import tqdm
-from typing import Tuple, Optional, Callable
+from tqdm.asyncio import tqdm_asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Tuple, Optional, Callable, Awaitable
 import logging
 
 pd.set_option('display.max_rows', 500)
@@ -18,83 +27,193 @@ pd.set_option('display.max_columns', 500)
 pd.set_option('display.width', 1000)
 pd.set_option('display.max_colwidth', 200)
 
+# Also write a CSV copy of each table alongside the Parquet file
+EXPORT_CSV = False
+
+# On-disk cache of ILGA responses, reused by reruns; delete the file to force a fresh crawl
+HTTP_CACHE_PATH = '.ilga_cache.sqlite'
+HTTP_CACHE_EXPIRE_AFTER = 7 * 24 * 3600
+
 # %%
-def _request_util(url: str, timeout: Tuple[int, int]=(10, 30), max_retries: int=5):
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_MAX_CONCURRENCY = 64
+_TIMEOUT = aiohttp.ClientTimeout(connect=10, sock_read=30)
+
+# Fork parse workers where available: this script has no __main__ guard, and
+# spawned workers would re-run it (and can't see functions defined in a kernel)
+_MP_CONTEXT = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+
+# Links in the IIS directory listings served under /ftp/
+_RE_LISTING_LINK = re.compile(rb'<a href="([^"]+)">([^<]+)</a>', re.IGNORECASE)
+
+# Filename outline levels; the unescaped '.' also matches variants like 'HArt ' and 'HArt,'
+_RE_LETTERS = re.compile(r'(A|F|K|HArt.|HTit.|HPt.|HDiv.|Hprec.|HCh.)')
+
+# All three _parse_filestring components in one pattern, for Series.str.extract
+_RE_FILESTRING = re.compile(
+    r'^(?P<ilcs_index_number>.{0,9})'
+    r'(?:.*?(?P<ilcs_index_type>A|F|K|HArt.|HTit.|HPt.|HDiv.|Hprec.|HCh.)(?P<ilcs_index_ext>.*?)\.html)?'
+)
+
+# Act page fields
+_RE_ILCS_CODE = re.compile(r'^\((.*?)\)')
+_RE_ACT_TITLE = re.compile(r'\((.*?)\)\s*\((.*?)\)')
+_RE_TITLE_DESC = re.compile(r'Title:\s*(.*)', re.DOTALL)
+_RE_CITE = re.compile(r'Cite:\s*(.*)')
+_RE_SOURCE = re.compile(r'Source:\s*(.*)')
+_RE_SHORT = re.compile(r'Short title:\s*(.*)')
+
+# Statute page ILCS code
+_RE_STATUTE_CODE = re.compile(r'\d+\s+ILCS\s+\d+/\d+[\w\-.]*')
+
+# Act text table columns and their (Arrow-backed) pandas dtypes
+_ACT_DTYPES = {
+    'ilcs_code': 'string',
+    'ilcs_act_title': 'string',
+    'title_description': 'string',
+    'cite': 'string',
+    'source': 'string',
+    'short_title': 'string',
+    'section_url': 'string',
+    'section_file': 'string'
+}
+
+# Statute text table columns and their pandas dtypes, in the order of _STATUTE_SCHEMA
+_STATUTE_DTYPES = {
+    'ilcs_code': 'string',
+    'section_number': 'string',
+    'statute_text': 'string',
+    'source': 'string',
+    'amended_statute': bool,
+    'section_url': 'string',
+    'section_file': 'string'
+}
+
+# Statute text table columns, as written to Parquet
+_STATUTE_SCHEMA = pa.schema([
+    pa.field('ilcs_code', pa.string()),
+    pa.field('section_number', pa.string()),
+    pa.field('statute_text', pa.large_string()),
+    pa.field('source', pa.string()),
+    pa.field('amended_statute', pa.bool_()),
+    pa.field('section_url', pa.string()),
+    pa.field('section_file', pa.string())
+])
+
+def _client_session() -> CachedSession:
+    """
+    Create the aiohttp session shared by all requests of a single crawl.
+
+    Idle ilga.gov connections are kept alive between requests and DNS
+    lookups are cached, so pages don't pay connection setup each time.
+    Successful responses are cached in HTTP_CACHE_PATH, so reruns within
+    HTTP_CACHE_EXPIRE_AFTER seconds skip the network.
+
+    Returns:
+        CachedSession: Caching session with a pooled connector capped per host
+    """
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=32,
+        keepalive_timeout=60,
+        ttl_dns_cache=300
+    )
+    cache = SQLiteBackend(
+        HTTP_CACHE_PATH,
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        allowed_codes=(200,),
+        allowed_methods=('GET',)
+    )
+    return CachedSession(cache=cache, connector=connector, timeout=_TIMEOUT)
+
+def _run(coro: Awaitable):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Falls back to a worker thread when an event loop is already running
+    (e.g. when the cells below are executed in a Jupyter/VS Code kernel).
+
+    Args:
+        coro (coroutine): The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+async def _afetch(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, max_retries: int=5) -> Optional[bytes]:
     """
-    Make HTTP GET request with retry logic and error handling.
+    Make asynchronous HTTP GET request with retry logic and error handling.
     
     Args:
+        session (aiohttp.ClientSession): Session shared by the crawl
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight
         url (str): The full URL to request
-        timeout (tuple): Connection and read timeout values
-        max_retries (int): Maximum number of retry attempts
+        max_retries (int): Maximum number of attempts
         
     Returns:
-        requests.Response or None: Response object if successful, None if failed
-        
-    Raises:
-        requests.exceptions.RequestException: For unrecoverable request errors
-    """
-    retry_strategy = Retry(
-        total=max_retries,
-        status_forcelist=[429, 500, 502, 503, 504],  
-        backoff_factor=1,
-        allowed_methods=["GET"] 
-    )
+        bytes or None: Raw response body if successful, None if failed
+    """
+    error = None
 
-    session = requests.Session()
-    session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+    for attempt in range(max_retries):
+        try:
+            async with semaphore, session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
 
-    try:
-        response = session.get(url, timeout=timeout)
-        response.raise_for_status()  
-        return response
-        
-    except requests.exceptions.Timeout as e:
-        logging.error(f"Request timed out for URL {url}: {e}")
-        return None
-        
-    except requests.exceptions.ConnectionError as e:
-        logging.error(f"Connection error for URL {url}: {e}")
-        return None
-        
-    except requests.exceptions.HTTPError as e:
-        logging.error(f"HTTP error for URL {url}: {e}")
-        return None
-        
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Request failed for URL {url}: {e}")
-        raise  
-        
-    finally:
-        session.close() 
+        except asyncio.TimeoutError as e:
+            error = f"Request timed out for URL {url}: {e}"
+
+        except aiohttp.ClientConnectionError as e:
+            error = f"Connection error for URL {url}: {e}"
 
-def _get_pages(url_path: str, base_url: str = "https://ilga.gov") -> pd.DataFrame:
+        except aiohttp.ClientResponseError as e:
+            error = f"HTTP error for URL {url}: {e}"
+            if e.status not in _RETRY_STATUS_CODES:
+                break
+
+        except aiohttp.ClientError as e:
+            # e.g. ClientPayloadError on a truncated body
+            error = f"Request failed for URL {url}: {e}"
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep(2 ** attempt)
+
+    logging.error(error)
+    return None
+
+async def _get_pages(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url_path: str, base_url: str = "https://ilga.gov") -> pd.DataFrame:
     """
     Fetches and parses links from FTP at https://ilga.gov/ftp/.
 
     Args:
+        session (aiohttp.ClientSession): Session shared by the crawl.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
         url_path (str, optional): Path to append to the base_url.
         base_url (str): Base URL of the site.
 
     Returns:
         pd.DataFrame: DataFrame with columns 'label' and 'href' for each link found.
     """
-    response = _request_util(url = f'{base_url}{url_path}')
-    soup = BeautifulSoup(response.text, 'html.parser')
-    pre_tag = soup.find('pre')
+    response_content = await _afetch(session, semaphore, url = f'{base_url}{url_path}')
     url_links = []
 
-    if pre_tag:
-        links = pre_tag.find_all('a')
-
-        for link in links:
-            href = link.get('href')
-            label = link.get_text()
+    # Listings have a fixed format, so scan the raw bytes instead of building a tree
+    for match in _RE_LISTING_LINK.finditer(response_content):
+        href = unescape(match.group(1).decode())
+        label = unescape(match.group(2).decode())
 
-            if label != "[To Parent Directory]":
-                url_links.append({"label": label, "href": href})
+        if label != "[To Parent Directory]":
+            url_links.append({"label": label, "href": href})
 
-    data = pd.json_normalize(url_links)
+    data = pd.DataFrame(url_links, columns=['label', 'href'])
     data = data[data['label'] != 'aReadMe']
 
     return(data)
@@ -113,8 +232,7 @@ def _parse_filestring(s: str) -> Tuple[str, str, str]:
         tuple: (first_9_digits, letters, remaining_numbers)
     """
     first_9_digits = s[:9]
-    letters_pattern = re.compile(r'(A|F|K|HArt.|HTit.|HPt.|HDiv.|Hprec.|HCh.)')
-    letters_match = letters_pattern.search(s[9:])
+    letters_match = _RE_LETTERS.search(s[9:])
     letters = ''
     if letters_match:
         letters = letters_match.group(0)
@@ -127,6 +245,38 @@ def _parse_filestring(s: str) -> Tuple[str, str, str]:
 
     return first_9_digits, letters, remaining_numbers
 
+async def _crawl_ilcs_pages(base_url:str, root_path:str) -> Tuple[pd.DataFrame, list, list]:
+    """
+    Concurrently fetch the chapter, act, and section listings of the ILGA FTP site.
+
+    Parameters:
+        base_url (str): top-level domain URL.
+        root_path (str): Root path to start crawling.
+
+    Returns:
+        tuple: (chapters_data, acts_data for each chapter,
+                sections_data for each act of each chapter)
+    """
+    async with _client_session() as session:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        chapters_data = await _get_pages(session, semaphore, base_url=base_url, url_path=root_path)
+
+        chapters_acts = await asyncio.gather(*[
+            _get_pages(session, semaphore, base_url=base_url, url_path=chapter_url)
+            for chapter_url in chapters_data['href']
+        ])
+
+        chapters_sections = await tqdm_asyncio.gather(*[
+            asyncio.gather(*[
+                _get_pages(session, semaphore, base_url=base_url, url_path=act_url)
+                for act_url in acts_data['href']
+            ])
+            for acts_data in chapters_acts
+        ], desc="Crawling Chapters")
+
+    return chapters_data, chapters_acts, chapters_sections
+
 def build_ilcs_index(base_url:str="https://ilga.gov", root_path:str="/ftp/ILCS/") -> pd.DataFrame:
     """
     Crawl the ILGA site hierarchy and build a DataFrame
@@ -149,40 +299,36 @@ def build_ilcs_index(base_url:str="https://ilga.gov", root_path:str="/ftp/ILCS/"
         'section_url': pd.Series(dtype='object')
         })
 
-    chapters_data = _get_pages(base_url=base_url, url_path=root_path)
-
-    for chapter_url in chapters_data['href']:
-        chapter_name = chapters_data.loc[
-            chapters_data['href'] == chapter_url, 'label'
-        ].values[0]
+    chapters_data, chapters_acts, chapters_sections = _run(
+        _crawl_ilcs_pages(base_url=base_url, root_path=root_path)
+    )
+    sections_frames = []
 
-        acts_data = _get_pages(base_url=base_url, url_path=chapter_url)
+    chapters = chapters_data[['href', 'label']].itertuples(index=False)
 
-        for act_url in acts_data['href']:
-            act_name = acts_data.loc[
-                acts_data['href'] == act_url, 'label'
-            ].values[0]
+    for (chapter_url, chapter_name), acts_data, acts_sections in zip(chapters, chapters_acts, chapters_sections):
+        acts = acts_data[['href', 'label']].itertuples(index=False)
 
-            sections_data = _get_pages(base_url=base_url, url_path=act_url)
+        for (act_url, act_name), sections_data in zip(acts, acts_sections):
             sections_data = sections_data.rename(columns={
                 'label': 'section_file',
                 'href': 'section_url'
-            })
-
-            print(f'Processing Chapter: {chapter_url}, Act: {act_url}')
+            }).assign(
+                chapter_name=chapter_name,
+                chapter_url=chapter_url,
+                act_name=act_name,
+                act_url=act_url
+            )
 
-            sections_data['chapter_name'] = chapter_name
-            sections_data['chapter_url'] = chapter_url
-            sections_data['act_name'] = act_name
-            sections_data['act_url'] = act_url
+            sections_frames.append(sections_data)
 
-            df_index = pd.concat(
-                [df_index, sections_data],
-                ignore_index=True
-            )
+    # Concatenate once rather than once per act
+    df_index = pd.concat(
+        [df_index, *sections_frames],
+        ignore_index=True
+    )
 
-    parsed = df_index['section_file'].apply(_parse_filestring)
-    df_index[['ilcs_index_number', 'ilcs_index_type', 'ilcs_index_ext']] = pd.DataFrame(parsed.tolist(), index=df_index.index)
+    df_index[['ilcs_index_number', 'ilcs_index_type', 'ilcs_index_ext']] = df_index['section_file'].str.extract(_RE_FILESTRING).fillna('')
 
     mapping = {
         'A': 'Chapter (A)',
@@ -199,26 +345,140 @@ def build_ilcs_index(base_url:str="https://ilga.gov", root_path:str="/ftp/ILCS/"
         'HCh ': 'Chapter (HChArt)',
     }
 
-    df_index['ilcs_index_type_label'] = df_index['ilcs_index_type'].map(mapping).fillna('Unknown')
+    # Label each unique type once rather than every row
+    df_index['ilcs_index_type'] = df_index['ilcs_index_type'].astype('category')
+    df_index['ilcs_index_type_label'] = df_index['ilcs_index_type'].map(
+        lambda index_type: mapping.get(index_type, 'Unknown')
+    ).astype('category')
+
+    # Store heavily repeated strings once per unique value
+    df_index = df_index.astype({
+        'chapter_name': 'category',
+        'chapter_url': 'category',
+        'act_name': 'category',
+        'act_url': 'category'
+    })
 
     return df_index
 
-def parse_act_page(url_path:str, base_url:str = "https://ilga.gov") -> pd.DataFrame:
+async def _fetch_pages(urls: list, base_url: str, desc: str) -> list:
+    """
+    Concurrently fetch the raw HTML of a list of URL paths.
+
+    Parameters:
+        urls (list): URL paths to fetch.
+        base_url (str): top-level domain URL.
+        desc (str): Progress bar description.
+
+    Returns:
+        list: Response body for each URL, in order, or None where the request failed.
+    """
+    async with _client_session() as session:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        return await tqdm_asyncio.gather(*[
+            _afetch(session, semaphore, url=f'{base_url}{url}')
+            for url in urls
+        ], desc=desc)
+
+def _parse_html(parse_fn: Callable[[bytes], dict], url: str, html: Optional[bytes]) -> Optional[dict]:
+    """
+    Apply a page parser to a single page, reporting failures instead of raising.
+
+    Parameters:
+        parse_fn (callable): Function to parse the page.
+        url (str): URL path of the page, used for error reporting.
+        html (bytes): Raw HTML of the page.
+
+    Returns:
+        dict or None: Parsed page, or None if parsing failed.
+    """
+    try:
+        return parse_fn(html)
+    except Exception as e:
+        print(f"[ERROR] Failed to parse {url}: {e}")
+        return None
+
+def _parse_pages(parse_fn: Callable[[bytes], dict], urls: list, pages: list, desc: str) -> list:
+    """
+    Parse fetched pages in parallel across CPU cores.
+
+    Parameters:
+        parse_fn (callable): Function to parse each page.
+        urls (list): URL paths of the pages.
+        pages (list): Raw HTML of each page.
+        desc (str): Progress bar description.
+
+    Returns:
+        list: Parsed result for each URL, in order, or None where parsing failed.
+    """
+    with ProcessPoolExecutor(mp_context=_MP_CONTEXT) as executor:
+        return list(tqdm(
+            executor.map(_parse_html, repeat(parse_fn), urls, pages, chunksize=32),
+            total=len(urls),
+            desc=desc
+        ))
+
+def _parse_urls(df_pages: pd.DataFrame, parse_fn: Callable[[bytes], dict], base_url: str, desc: str) -> list:
+    """
+    Fetch pages concurrently, then parse them in parallel.
+
+    Parameters:
+        df_pages (pd.DataFrame): ILGA URLs to parse, with section_url and section_file columns.
+        parse_fn (callable): Function to parse the HTML of each page.
+        base_url (str): top-level domain URL.
+        desc (str): Progress bar description.
+
+    Returns:
+        list: Parsed dict for each page that parsed, with its section_url and section_file.
+    """
+    urls = df_pages['section_url'].tolist()
+    pages = _run(_fetch_pages(urls, base_url=base_url, desc=f"Fetching {desc}"))
+    parsed_pages = _parse_pages(parse_fn, urls, pages, desc=f"Parsing {desc}")
+
+    return [
+        {**parsed, 'section_url': url, 'section_file': section_file}
+        for url, section_file, parsed in zip(urls, df_pages['section_file'], parsed_pages)
+        if parsed is not None
+    ]
+
+def _html_encoding(html: bytes) -> str:
+    """
+    Pick the encoding of an ILGA page without statistical charset sniffing.
+
+    Uses the encoding declared in the page if there is one, otherwise UTF-8
+    if the bytes decode cleanly, otherwise windows-1252.
+
+    Args:
+        html (bytes): Raw HTML of the page.
+
+    Returns:
+        str: Encoding to pass to the HTML parser.
+    """
+    declared_encoding = EncodingDetector.find_declared_encoding(html, is_html=True)
+    if declared_encoding:
+        return declared_encoding
+
+    try:
+        html.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+def parse_act_page(html: bytes) -> dict:
     """
     Extracts Act text elements from ILGA HTML page using BeautifulSoup
-    and organizes them into a pandas DataFrame.
+    and organizes them into a dictionary.
 
     Args:
-        url_path (str): the URL path that follows the base_url.
-        base_url (str):  top-level domain URL.
+        html (bytes): Raw HTML of the Act page.
 
     Returns:
-        pandas.DataFrame: A DataFrame with columns for ILCS code, ILCS act title,
-                        title description, cite, source, and short title.
+        dict: A dictionary with keys for ILCS code, ILCS act title,
+              title description, cite, source, and short title.
     """
 
-    response = _request_util(url = f'{base_url}{url_path}')
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml', from_encoding=_html_encoding(html))
     data = {}
 
     # Find the main div containing the text
@@ -227,41 +487,41 @@ def parse_act_page(url_path:str, base_url:str = "https://ilga.gov") -> pd.DataFr
         full_text = div.get_text(separator='\n', strip=True)
 
         # Extract ILCS code
-        ilcs_code_match = re.search(r'^\((.*?)\)', full_text)
+        ilcs_code_match = _RE_ILCS_CODE.search(full_text)
         data['ilcs_code'] = ilcs_code_match.group(1) if ilcs_code_match else None
 
         # Extract ILCS act title 
-        act_title_match = re.search(r'\((.*?)\)\s*\((.*?)\)', full_text)
+        act_title_match = _RE_ACT_TITLE.search(full_text)
         data['ilcs_act_title'] = act_title_match.group(2) if act_title_match else None
 
         # Extract other fields
-        title_desc_match = re.search(r'Title:\s*(.*)', full_text, re.DOTALL)
+        title_desc_match = _RE_TITLE_DESC.search(full_text)
         if title_desc_match:
             title_text = title_desc_match.group(1).split('Cite:')[0].strip()
             data['title_description'] = ' '.join(title_text.split())
         else:
             data['title_description'] = None
 
-        cite_match = re.search(r'Cite:\s*(.*)', full_text)
+        cite_match = _RE_CITE.search(full_text)
         data['cite'] = cite_match.group(1).strip() if cite_match else None
 
-        source_match = re.search(r'Source:\s*(.*)', full_text)
+        source_match = _RE_SOURCE.search(full_text)
         data['source'] = source_match.group(1).strip() if source_match else None
 
-        short_title_match = re.search(r'Short title:\s*(.*)', full_text)
+        short_title_match = _RE_SHORT.search(full_text)
         data['short_title'] = short_title_match.group(1).strip() if short_title_match else None
 
-    df = pd.DataFrame([data])
-    return df
+    return data
 
-def build_acts_text_table(df_urls:pd.DataFrame, parse_fn: Callable[[str], pd.DataFrame], act_label:str="Act (F)") -> pd.DataFrame:
+def build_acts_text_table(df_urls:pd.DataFrame, parse_fn: Callable[[bytes], dict], act_label:str="Act (F)", base_url:str="https://ilga.gov") -> pd.DataFrame:
     """
     Build a table of Act text by parsing all Act (F) URLs.
 
     Parameters:
         df_urls (pd.DataFrame): Input DataFrame containing ILGA URLs.
-        parse_fn (callable): Function to parse each Act page.
+        parse_fn (callable): Function to parse the HTML of each Act page.
         act_label (str): Label to filter to Acts. Defaults to "Act (F)".
+        base_url (str): top-level domain URL.
 
     Returns:
         pd.DataFrame: Concatenated DataFrame with Act text data.
@@ -269,47 +529,47 @@ def build_acts_text_table(df_urls:pd.DataFrame, parse_fn: Callable[[str], pd.Dat
     # Filter for acts
     df_acts = df_urls[df_urls['ilcs_index_type_label'] == act_label]
 
-    df_acts_text = pd.DataFrame(columns=[
-        'ilcs_code',
-        'ilcs_act_title',
-        'title_description',
-        'cite',
-        'source',
-        'short_title',
-        'section_url'
-    ])
-
-    # Loop through act URLs
-    for url in tqdm(df_acts['section_url'], desc="Parsing Acts"):
-        try:
-            df_parsed = parse_fn(url_path=url)
-            df_parsed['section_url'] = url
-            df_acts_text = pd.concat([df_acts_text, df_parsed], ignore_index=True)
-        except Exception as e:
-            print(f"[ERROR] Failed to parse {url}: {e}")
-    
-    df_acts_text = pd.merge(left = df_acts_text, right = df_urls[['section_url','section_file']], how='left', on='section_url')
+    rows = _parse_urls(df_acts, parse_fn, base_url=base_url, desc="Acts")
+
+    df_acts_text = pd.DataFrame.from_records(rows, columns=list(_ACT_DTYPES)).astype(_ACT_DTYPES)
 
     return df_acts_text
 
-def parse_statute_page(url_path:str, base_url:str="https://ilga.gov") -> pd.DataFrame:
+def _iter_strings(root: lxml_html.HtmlElement):
     """
-    Extracts Statute text elements from ILGA HTML page using BeautifulSoup
-    and organizes them into a pandas DataFrame.
+    Yield each text node under an lxml element in document order, like
+    BeautifulSoup's .strings: comment, script, and style text is skipped.
 
     Args:
-        url_path (str): the URL path that follows the base_url.
-        base_url (str): top-level domain URL.
+        root (lxml.html.HtmlElement): Element to walk.
+
+    Yields:
+        tuple: (element the text belongs to, text)
+    """
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        if event == 'start':
+            if element.text and isinstance(element.tag, str) and element.tag not in ('script', 'style'):
+                yield element, element.text
+        elif element is not root and element.tail:
+            yield element.getparent(), element.tail
+
+def parse_statute_page(html: bytes) -> dict:
+    """
+    Extracts Statute text elements from ILGA HTML page using lxml
+    and organizes them into a dictionary.
+
+    Args:
+        html (bytes): Raw HTML of the Statute page.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the extracted information
-                        for the statute, with columns for ILCS Code,
-                        Section Number, Statute Text,
-                        Source, and an Amended Statute Flag.
+        dict: A dictionary containing the extracted information
+              for the statute, with keys for ILCS Code,
+              Section Number, Statute Text,
+              Source, and an Amended Statute Flag.
     """
 
-    response = _request_util(url=f'{base_url}{url_path}')
-    soup = BeautifulSoup(response.text, 'html.parser')
+    parser = lxml_html.HTMLParser(encoding=_html_encoding(html))
+    tree = lxml_html.document_fromstring(html, parser=parser)
 
     data = {
         'ilcs_code': None,
@@ -320,28 +580,50 @@ def parse_statute_page(url_path:str, base_url:str="https://ilga.gov") -> pd.Data
     }
 
     # Extract ILCS code 
-    ilcs_code_match = soup.find(string=re.compile(r'\(?\d+\s+ILCS\s+\d+/\d+[\w\-.]*\)?'))
-    if ilcs_code_match:
-        ilcs_code_clean = re.search(r'\d+\s+ILCS\s+\d+/\d+[\w\-.]*', ilcs_code_match)
-        if ilcs_code_clean:
-            data['ilcs_code'] = ilcs_code_clean.group(0)
+    for text in tree.itertext():
+        ilcs_code_match = _RE_STATUTE_CODE.search(text)
+        if ilcs_code_match:
+            data['ilcs_code'] = ilcs_code_match.group(0)
+            break
+
+    # Get all text lines, with the indentation preceding each text element
+    lines = []
+    for element, string in _iter_strings(tree.body):
+        text = string.strip()
+        if not text:
+            continue
+
+        # The whitespace before the element is the previous sibling's tail,
+        # or the parent's text if the element comes first
+        previous = element.getprevious()
+        if previous is not None:
+            leading_whitespace = previous.tail
+        elif element.getparent() is not None:
+            leading_whitespace = element.getparent().text
+        else:
+            leading_whitespace = None
 
-    # Get all text
-    all_text = soup.body.get_text(separator='\n', strip=True)
+        # Count spaces and non-breaking spaces in place, without building the whitespace string
+        indent_spaces = 0
+        if leading_whitespace:
+            indent_spaces = leading_whitespace.count(' ') + leading_whitespace.count('\xa0')
 
-    # Indicate amended statute
-    if "Text of Section after amendment" in all_text:
-        data['amended_statute'] = True
-        all_text = all_text.split("Text of Section after amendment", 1)[1]
+        for line in text.split('\n'):
+            lines.append((indent_spaces, line.strip()))
 
-    lines = all_text.split('\n')
+    # Indicate amended statute
+    for i, (indent_spaces, line) in enumerate(lines):
+        if "Text of Section after amendment" in line:
+            data['amended_statute'] = True
+            line = line.split("Text of Section after amendment", 1)[1]
+            lines = [(indent_spaces, line.strip())] + lines[i + 1:]
+            break
 
     found_section = False
     found_statute_text = False
     statute_text_lines = []
 
-    for line in lines:
-        line = line.strip()
+    for indent_spaces, line in lines:
         if not line:
             continue
 
@@ -364,31 +646,21 @@ def parse_statute_page(url_path:str, base_url:str="https://ilga.gov") -> pd.Data
 
         # Collect statute text
         if found_statute_text:
-            original_element = soup.find(string=re.compile(re.escape(line)))
-            if original_element:
-                leading_whitespace = ''
-                for sibling in original_element.parent.previous_siblings:
-                    if isinstance(sibling, str):
-                        leading_whitespace = sibling + leading_whitespace
-                    else:
-                        break
-                indent_spaces = leading_whitespace.replace('\xa0', ' ').count(' ')
-                statute_text_lines.append(' ' * indent_spaces + line)
-            else:
-                statute_text_lines.append(line)
+            statute_text_lines.append(' ' * indent_spaces + line)
 
     data['statute_text'] = '\n'.join(statute_text_lines).strip()
 
-    return pd.DataFrame([data])
+    return data
 
-def build_statutes_text_table(df_urls:str, parse_fn: Callable[[str], pd.DataFrame], section_label:str="Section (K)") -> pd.DataFrame:
+def build_statutes_text_table(df_urls:str, parse_fn: Callable[[bytes], dict], section_label:str="Section (K)", base_url:str="https://ilga.gov") -> pd.DataFrame:
     """
     Build a table of Statute text by parsing all Section (K) URLs.
 
     Parameters:
         df_urls (pd.DataFrame): Input DataFrame containing ILGA URLs.
-        parse_fn (callable): Function to parse each Statute page.
+        parse_fn (callable): Function to parse the HTML of each Statute page.
         section_label (str): Label to filter sections. Defaults to "Section (K)".
+        base_url (str): top-level domain URL.
 
     Returns:
         pd.DataFrame: Concatenated DataFrame with Statute text data.
@@ -396,33 +668,42 @@ def build_statutes_text_table(df_urls:str, parse_fn: Callable[[str], pd.DataFram
     # Filter for sections
     df_statutes = df_urls[df_urls['ilcs_index_type_label'] == section_label]
 
-    df_statutes_text = pd.DataFrame(columns=[
-        'ilcs_code',
-        'section_number',
-        'statute_text',
-        'source',
-        'amended_statute',
-        'section_url'
-    ])
-
-    # Loop through section URLs 
-    for url in tqdm(df_statutes['section_url'], desc="Parsing Statutes"):
-        try:
-            df_parsed = parse_fn(url_path=url)
-            df_parsed['section_url'] = url
-            df_statutes_text = pd.concat([df_statutes_text, df_parsed], ignore_index=True)
-        except Exception as e:
-            print(f"[ERROR] Failed to parse {url}: {e}")
+    rows = _parse_urls(df_statutes, parse_fn, base_url=base_url, desc="Statutes")
 
-    df_statutes_text = pd.merge(left = df_statutes_text, right = df_urls[['section_url','section_file']], how='left', on='section_url')
+    df_statutes_text = pd.DataFrame.from_records(rows, columns=_STATUTE_SCHEMA.names).astype(_STATUTE_DTYPES)
 
     return df_statutes_text
 
+def write_statutes_text_parquet(df_urls:pd.DataFrame, parse_fn: Callable[[bytes], dict], path:str, section_label:str="Section (K)", base_url:str="https://ilga.gov", batch_size:int=1000) -> None:
+    """
+    Parse all Section (K) URLs and stream the Statute text to a Parquet file
+    in batches, so only one batch of pages is held in memory at a time.
+
+    Parameters:
+        df_urls (pd.DataFrame): Input DataFrame containing ILGA URLs.
+        parse_fn (callable): Function to parse the HTML of each Statute page.
+        path (str): Parquet file to write.
+        section_label (str): Label to filter sections. Defaults to "Section (K)".
+        base_url (str): top-level domain URL.
+        batch_size (int): Number of pages fetched, parsed, and written per batch.
+    """
+    # Filter for sections
+    df_statutes = df_urls[df_urls['ilcs_index_type_label'] == section_label]
+
+    with pq.ParquetWriter(path, _STATUTE_SCHEMA, compression='zstd') as writer:
+        for start in range(0, len(df_statutes), batch_size):
+            df_batch = df_statutes.iloc[start:start + batch_size]
+            desc = f"Statutes {start + 1}-{start + len(df_batch)} of {len(df_statutes)}"
+            rows = _parse_urls(df_batch, parse_fn, base_url=base_url, desc=desc)
+
+            writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=_STATUTE_SCHEMA))
+
 # %% 
 # Build ILCS URL index
 df_ilga_urls = build_ilcs_index()
-df_ilga_urls.to_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-links.parquet')
-df_ilga_urls.to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-links.csv')
+df_ilga_urls.to_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-links.parquet', compression='zstd', engine='pyarrow')
+if EXPORT_CSV:
+    df_ilga_urls.to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-links.csv')
 
 # %%
 df_ilga_urls = pd.read_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-links.parquet')
@@ -435,8 +716,9 @@ df_acts_text = build_acts_text_table(
 
 # %%
 # Write the Act text data
-df_acts_text.to_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-act-text.parquet')
-df_acts_text.to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-act-text.csv')
+df_acts_text.to_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-act-text.parquet', compression='zstd', engine='pyarrow')
+if EXPORT_CSV:
+    df_acts_text.to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-act-text.csv')
 
 # %%
 # Subset of most relevant chapters and acts
@@ -448,15 +730,13 @@ chapter_act_list['ilcs_index_number'] = chapter_act_list['chapter_num'] + chapte
 df_ilga_urls_subset = pd.merge(left = df_ilga_urls, right = chapter_act_list, how='inner', on='ilcs_index_number')
 
 # %%
-# Build table of ILCS Statute text
-df_statutes_text = build_statutes_text_table(
+# Build and write the Statute text data, streaming batches to Parquet
+write_statutes_text_parquet(
     df_urls=df_ilga_urls_subset,
-    parse_fn=parse_statute_page)
-
-# %%
-# Write the Statute text data
-df_statutes_text.to_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-statutes-text.parquet')
-df_statutes_text.to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-statutes-text.csv')
+    parse_fn=parse_statute_page,
+    path='/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-statutes-text.parquet')
+if EXPORT_CSV:
+    pd.read_parquet('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-statutes-text.parquet').to_csv('/mnt/c/Users/nicholasmarchio/OneDrive - Cook County Government/Desktop/projects/statute-xwalk/ilcs-statutes-text.csv')
 
 # %%
 # Read all files